@@ -1,5 +1,5 @@
 from collections.abc import AsyncGenerator
-from functools import reduce
+from functools import lru_cache, reduce
 
 from acp_sdk import Message
 from acp_sdk.models import MessagePart
@@ -13,9 +13,15 @@ from code_reviewer_tool import CodeReviewerTool
 server = Server()
 
 
+@lru_cache(maxsize=4)
+def get_llm(name: str) -> ChatModel:
+    # Reused across runs instead of being rebuilt for every request
+    return ChatModel.from_name(name)
+
+
 @server.agent()
 async def code_reviewer(input: list[Message]) -> AsyncGenerator:
-    llm = ChatModel.from_name("ollama:llama3.1:8b")
+    llm = get_llm("ollama:llama3.1:8b")
 
     agent = ReActAgent(llm=llm, tools=[], memory=TokenMemory(llm))
     response = await agent.run(
@@ -27,7 +33,7 @@ async def code_reviewer(input: list[Message]) -> AsyncGenerator:
 
 @server.agent(name="generator")
 async def main_agent(input: list[Message], context: Context) -> AsyncGenerator:
-    llm = ChatModel.from_name("ollama:llama3.1:8b")
+    llm = get_llm("ollama:llama3.1:8b")
 
     agent = ReActAgent(
         llm=llm,
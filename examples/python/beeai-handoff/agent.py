@@ -1,5 +1,6 @@
 from collections import defaultdict
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 
 import beeai_framework
 from acp_sdk import Message
@@ -12,9 +13,16 @@ from beeai_framework.memory import TokenMemory
 from run_agent_tool import HandoffTool
 
 server = Server()
+
 session_storage = defaultdict(list[Message])
 
 
+@lru_cache(maxsize=4)
+def get_llm(name: str) -> ChatModel:
+    # Shared by all agents and runs, TokenMemory counts tokens through the same model
+    return ChatModel.from_name(name)
+
+
 def to_framework_message(role: Role, content: str) -> beeai_framework.backend.Message:
     match role:
         case Role.USER:
@@ -34,7 +42,7 @@ def to_acp_message(message: beeai_framework.backend.Message) -> Message:
 
 @server.agent()
 async def spanish_agent(input: list[Message]) -> AsyncGenerator:
-    llm = ChatModel.from_name("ollama:llama3.1:8b")
+    llm = get_llm("ollama:llama3.1:8b")
     print("Calling Spanish agent")
 
     agent = ReActAgent(
@@ -58,7 +66,7 @@ async def spanish_agent(input: list[Message]) -> AsyncGenerator:
 
 @server.agent()
 async def english_agent(input: list[Message]) -> AsyncGenerator:
-    llm = ChatModel.from_name("ollama:llama3.1:8b")
+    llm = get_llm("ollama:llama3.1:8b")
     print("Calling English agent")
     agent = ReActAgent(
         llm=llm,
@@ -83,7 +91,7 @@ async def english_agent(input: list[Message]) -> AsyncGenerator:
 async def main_agent(input: list[Message], context: Context) -> AsyncGenerator:
     session_storage[context.session.id].extend(input)
 
-    llm = ChatModel.from_name("ollama:llama3.1:8b")
+    llm = get_llm("ollama:llama3.1:8b")
     agent = ReActAgent(
         llm=llm,
         tools=[
@@ -1,5 +1,6 @@
+import asyncio
 from collections.abc import AsyncGenerator
-from functools import reduce
+from functools import lru_cache
 
 from acp_sdk import Message
 from acp_sdk.models import MessagePart
@@ -8,34 +9,57 @@ from beeai_framework.agents.react import ReActAgent
 from beeai_framework.backend.chat import ChatModel
 from beeai_framework.memory import TokenMemory
 from beeai_framework.utils.dicts import exclude_none
+from semantic_cache import SemanticCache
 from translation_tool import TranslationTool
 
 server = Server()
+cache = SemanticCache()
+
+
+@lru_cache(maxsize=4)
+def get_llm(name: str) -> ChatModel:
+    # The chat model handle is stateless between runs, so build it once per model name
+    return ChatModel.from_name(name)
 
 
 @server.agent()
 async def translation_spanish(input: list[Message]) -> AsyncGenerator:
-    llm = ChatModel.from_name("ollama:llama3.1:8b")
+    text = "".join(str(message) for message in input)
+    # Model inference is blocking, keep it off the event loop shared with other runs
+    embedding = await asyncio.to_thread(cache.encode, text)
+    if (hit := cache.get("spanish", embedding)) is not None:
+        yield MessagePart(content=hit)
+        return
+
+    llm = get_llm("ollama:llama3.1:8b")
 
     agent = ReActAgent(llm=llm, tools=[], memory=TokenMemory(llm))
-    response = await agent.run(prompt="Translate the given text to Spanish. The text is: " + str(input))
+    response = await agent.run(prompt="Translate the given text to Spanish. The text is: " + text)
+    cache.put("spanish", embedding, response.result.text)
 
     yield MessagePart(content=response.result.text)
 
 
 @server.agent()
 async def translation_french(input: list[Message]) -> AsyncGenerator:
-    llm = ChatModel.from_name("ollama:llama3.1:8b")
+    text = "".join(str(message) for message in input)
+    embedding = await asyncio.to_thread(cache.encode, text)
+    if (hit := cache.get("french", embedding)) is not None:
+        yield MessagePart(content=hit)
+        return
+
+    llm = get_llm("ollama:llama3.1:8b")
 
     agent = ReActAgent(llm=llm, tools=[], memory=TokenMemory(llm))
-    response = await agent.run(prompt="Translate the given text to French. The text is: " + str(input))
+    response = await agent.run(prompt="Translate the given text to French. The text is: " + text)
+    cache.put("french", embedding, response.result.text)
 
     yield MessagePart(content=response.result.text)
 
 
 @server.agent(name="router")
 async def main_agent(input: list[Message], context: Context) -> AsyncGenerator:
-    llm = ChatModel.from_name("ollama:llama3.1:8b")
+    llm = get_llm("ollama:llama3.1:8b")
 
     agent = ReActAgent(
         llm=llm,
@@ -46,6 +70,7 @@ async def main_agent(input: list[Message], context: Context) -> AsyncGenerator:
                     {
                         "instructions": """
                         Translate the given text to either Spanish or French using the translation tool.
+                        If there are multiple numbered texts, pass all of them to a single tool call.
                         Return only the result from the tool as it is, don't change it.
                     """,
                         "role": "system",
@@ -56,8 +81,10 @@ async def main_agent(input: list[Message], context: Context) -> AsyncGenerator:
         memory=TokenMemory(llm),
     )
 
-    prompt = reduce(lambda x, y: x + y, input)
-    response = await agent.run(str(prompt))
+    prompt = (
+        str(input[0]) if len(input) == 1 else "\n".join(f"{i}. {message}" for i, message in enumerate(input, start=1))
+    )
+    response = await agent.run(prompt)
 
     yield MessagePart(content=response.result.text)
 
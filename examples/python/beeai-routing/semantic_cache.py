@@ -0,0 +1,51 @@
+import threading
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+
+class SemanticCache:
+    """In-memory cache of LLM responses keyed by embedding similarity of the normalized input"""
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", threshold: float = 0.92, limit: int = 10_000) -> None:
+        self._model_name = model_name
+        self._model: SentenceTransformer | None = None
+        self._model_lock = threading.Lock()
+        self._threshold = threshold
+        self._limit = limit
+        # Per key ring buffer of embeddings, allocated once and overwritten oldest first when full
+        self._embeddings: dict[str, np.ndarray] = {}
+        self._values: dict[str, list[str]] = {}
+        self._next: dict[str, int] = {}
+
+    def encode(self, text: str) -> np.ndarray:
+        # Load the model on first use, encode runs in worker threads
+        with self._model_lock:
+            if self._model is None:
+                self._model = SentenceTransformer(self._model_name)
+        # Embeddings are normalized, so the dot product equals cosine similarity
+        return self._model.encode(text.strip().lower(), normalize_embeddings=True).astype(np.float32)
+
+    def get(self, key: str, embedding: np.ndarray, threshold: float | None = None) -> str | None:
+        values = self._values.get(key)
+        if not values:
+            return None
+        similarities = self._embeddings[key][: len(values)] @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < (threshold if threshold is not None else self._threshold):
+            return None
+        return values[best]
+
+    def put(self, key: str, embedding: np.ndarray, value: str) -> None:
+        if key not in self._embeddings:
+            self._embeddings[key] = np.empty((self._limit, embedding.shape[0]), dtype=np.float32)
+            self._values[key] = []
+            self._next[key] = 0
+        values = self._values[key]
+        position = self._next[key]
+        self._embeddings[key][position] = embedding
+        if position < len(values):
+            values[position] = value
+        else:
+            values.append(value)
+        self._next[key] = (position + 1) % self._limit
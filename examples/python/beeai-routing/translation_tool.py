@@ -1,3 +1,4 @@
+import asyncio
 from enum import Enum
 
 from acp_sdk import Message
@@ -13,11 +14,10 @@ from pydantic import BaseModel, Field
 
 
 
-async def run_agent(agent: str, input: str) -> list[Message]:
-    async with Client(base_url="http://localhost:8000") as client:
-        run = await client.run_sync(
-            agent=agent, input=[Message(parts=[MessagePart(content=input, content_type="text/plain")])]
-        )
+async def run_agent(client: Client, agent: str, input: str) -> list[Message]:
+    run = await client.run_sync(
+        agent=agent, input=[Message(parts=[MessagePart(content=input, content_type="text/plain")])]
+    )
 
     return run.output
 
@@ -29,12 +29,12 @@ class Language(str, Enum):
 
 
 class TranslateToolInput(BaseModel):
-    text: str = Field(description="The text to translate")
-    language: Language = Field(description="The language to translate the text to")
+    texts: list[str] = Field(description="The texts to translate, all of them are translated at once")
+    language: Language = Field(description="The language to translate the texts to")
 
 
 class TranslateToolResult(BaseModel):
-    text: str = Field(description="The translated text")
+    texts: list[str] = Field(description="The translated texts in the same order")
 
 
 class TranslateToolOutput(ToolOutput):
@@ -44,7 +44,7 @@ class TranslateToolOutput(ToolOutput):
         return to_json(self.result)
 
     def is_empty(self) -> bool:
-        return self.result.text == ""
+        return not any(self.result.texts)
 
     def __init__(self, result: TranslateToolResult) -> None:
         super().__init__()
@@ -65,9 +65,10 @@ class TranslationTool(Tool[TranslateToolInput, ToolRunOptions, TranslateToolOutp
     async def _run(
         self, input: TranslateToolInput, options: ToolRunOptions | None, context: RunContext
     ) -> TranslateToolOutput:
-        if input.language == Language.spanish:
-            result = await run_agent("translation_spanish", input.text)
-        elif input.language == Language.french:
-            result = await run_agent("translation_french", input.text)
+        agent = {Language.spanish: "translation_spanish", Language.french: "translation_french"}[input.language]
+
+        # Translate all texts concurrently over a single connection pool
+        async with Client(base_url="http://localhost:8000") as client:
+            results = await asyncio.gather(*(run_agent(client, agent, text) for text in input.texts))
 
-        return TranslateToolOutput(result=TranslateToolResult(text=str(result[0])))
+        return TranslateToolOutput(result=TranslateToolResult(texts=[str(result[0]) for result in results]))
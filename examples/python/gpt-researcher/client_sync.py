@@ -4,14 +4,18 @@ from acp_sdk.client import Client
 from acp_sdk.models import Message, MessagePart
 
 
-async def client() -> None:
+async def client(texts: list[str]) -> None:
+    # All requests share one client and its connection pool, so connections are set up once and reused
     async with Client(base_url="http://localhost:8000") as client:
-        run = await client.run_sync(
-            agent="gpt_researcher",
-            input=[Message(parts=[MessagePart(content="Protocols focused on agent to agent communication")])],
+        runs = await asyncio.gather(
+            *(
+                client.run_sync(agent="gpt_researcher", input=[Message(parts=[MessagePart(content=text)])])
+                for text in texts
+            )
         )
-        print(run)
+        for run in runs:
+            print(run)
 
 
 if __name__ == "__main__":
-    asyncio.run(client())
+    asyncio.run(client(["Protocols focused on agent to agent communication"]))
@@ -1,6 +1,5 @@
 from collections.abc import AsyncGenerator
 from datetime import datetime
-from functools import reduce
 from typing import TypedDict
 
 from acp_sdk.models import Message
@@ -17,38 +16,22 @@ class AgentState(TypedDict):
     greeting: str
 
 
-def get_current_hour(state: AgentState) -> dict[str, int]:
-    now = datetime.now()
-    return {"hour": now.hour}
+GREETING_BY_HOUR = tuple(
+    "Good morning" if 6 <= hour < 12 else "Good afternoon" if 12 <= hour < 18 else "Good evening" for hour in range(24)
+)
 
 
-def decide_greeting(state: AgentState) -> dict[str, str]:
-    hour = state["hour"]
-    if 6 <= hour < 12:
-        return {"greeting": "Good morning"}
-    elif 12 <= hour < 18:
-        return {"greeting": "Good afternoon"}
-    else:
-        return {"greeting": "Good evening"}
+def greet(state: AgentState) -> dict[str, str | int]:
+    hour = datetime.now().hour
+    greeting = GREETING_BY_HOUR[hour]
+    return {"hour": hour, "greeting": greeting, "final_response": f"{greeting} {state['name']}"}
 
 
-def format_response(state: AgentState) -> dict[str, str]:
-    return {"final_response": f"{state['greeting']} {state['name']}"}
-
-
-# create graph
+# create graph with a single node, the steps are too cheap to be worth separate graph updates
 workflow = StateGraph(AgentState)
-
-# add nodes
-workflow.add_node("get_time", RunnableLambda(get_current_hour))
-workflow.add_node("decide_greeting", RunnableLambda(decide_greeting))
-workflow.add_node("format_response", RunnableLambda(format_response))
-
-# connect nodes
-workflow.set_entry_point("get_time")
-workflow.add_edge("get_time", "decide_greeting")
-workflow.add_edge("decide_greeting", "format_response")
-workflow.set_finish_point("format_response")
+workflow.add_node("greet", RunnableLambda(greet))
+workflow.set_entry_point("greet")
+workflow.set_finish_point("greet")
 
 graph = workflow.compile()
 
@@ -58,13 +41,13 @@ server = Server()
 @server.agent()
 async def lang_graph_greeting_agent(input: list[Message]) -> AsyncGenerator[RunYield, RunYieldResume]:
     """LangGraph agent that greets the user based on the current time."""
-    query = reduce(lambda x, y: x + y, input)
+    query = "".join(str(message) for message in input)
     output = None
-    async for event in graph.astream({"name": str(query)}, stream_mode="updates"):
+    async for event in graph.astream({"name": query}, stream_mode="updates"):
         for value in event.items():
             yield {"update": value}
         output = event
-    yield MessagePart(content=output.get("format_response", {}).get("final_response", ""))
+    yield MessagePart(content=output.get("greet", {}).get("final_response", ""))
 
 
 server.run()
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import timedelta
@@ -9,10 +9,10 @@ import httpx
 import obstore.store
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.applications import AppType, Lifespan
-from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from obstore.exceptions import NotFoundError
+from sse_starlette.sse import EventSourceResponse
 
 from acp_sdk.models import (
     ACPError,
@@ -104,6 +104,14 @@ def create_app(
     )
 
     agents: dict[AgentName, AgentManifest] = {agent.name: agent for agent in agents}
+    agent_models: dict[AgentName, AgentModel] = {
+        agent.name: AgentModel(name=agent.name, description=agent.description, metadata=agent.metadata)
+        for agent in agents.values()
+    }
+    # Agents are fixed for the lifetime of the app, serialize their manifests once
+    agents_list_json = AgentsListResponse(agents=list(agent_models.values())).model_dump_json()
+    agent_json = {name: model.model_dump_json() for name, model in agent_models.items()}
+    ping_json = PingResponse().model_dump_json()
 
     store = store or MemoryStore(limit=1000, ttl=timedelta(hours=1))
     run_store = store.as_store(model=RunData, prefix="run_")
@@ -136,26 +144,59 @@ def create_app(
             raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
         return agent
 
-    @app.get("/agents")
-    async def list_agents() -> AgentsListResponse:
-        return AgentsListResponse(
-            agents=[
-                AgentModel(name=agent.name, description=agent.description, metadata=agent.metadata)
-                for agent in agents.values()
-            ]
+    def run_response(
+        run: Run, *, status_code: int = status.HTTP_200_OK, headers: dict[str, str] | None = None
+    ) -> Response:
+        return Response(
+            status_code=status_code, headers=headers, content=run.model_dump_json(), media_type="application/json"
         )
 
-    @app.get("/agents/{name}")
-    async def read_agent(name: AgentName) -> AgentReadResponse:
-        agent = find_agent(name)
-        return AgentModel(name=agent.name, description=agent.description, metadata=agent.metadata)
-
-    @app.get("/ping")
-    async def ping() -> PingResponse:
-        return PingResponse()
+    async def stream_response(
+        run_data: RunData, *, idx: int, headers: dict[str, str] | None, ready: asyncio.Event | None
+    ) -> Response:
+        # Compressing intermediaries would hold events back until a block fills, ask them not to
+        return EventSourceResponse(
+            stream_sse(run_data, run_store, idx, ready=ready),
+            headers={**(headers or {}), "Content-Encoding": "identity"},
+            ping=15,
+        )
 
-    @app.post("/runs")
-    async def create_run(request: RunCreateRequest, req: Request) -> RunCreateResponse:
+    async def sync_response(
+        run_data: RunData, *, idx: int, headers: dict[str, str] | None, ready: asyncio.Event | None
+    ) -> Response:
+        run_data = await wait_util_stop(run_data, run_store, ready=ready)
+        return run_response(run_data.run, headers=headers)
+
+    async def async_response(
+        run_data: RunData, *, idx: int, headers: dict[str, str] | None, ready: asyncio.Event | None
+    ) -> Response:
+        if ready:
+            ready.set()
+        return run_response(run_data.run, status_code=status.HTTP_202_ACCEPTED, headers=headers)
+
+    mode_responses: dict[RunMode, Callable[..., Awaitable[Response]]] = {
+        RunMode.STREAM: stream_response,
+        RunMode.SYNC: sync_response,
+        RunMode.ASYNC: async_response,
+    }
+
+    @app.get("/agents", response_model=AgentsListResponse)
+    async def list_agents() -> Response:
+        return Response(content=agents_list_json, media_type="application/json")
+
+    @app.get("/agents/{name}", response_model=AgentReadResponse)
+    async def read_agent(name: AgentName) -> Response:
+        content = agent_json.get(name)
+        if content is None:
+            raise HTTPException(status_code=404, detail=f"Agent {name} not found")
+        return Response(content=content, media_type="application/json")
+
+    @app.get("/ping", response_model=PingResponse)
+    async def ping() -> Response:
+        return Response(content=ping_json, media_type="application/json")
+
+    @app.post("/runs", response_model=RunCreateResponse)
+    async def create_run(request: RunCreateRequest, req: Request) -> Response:
         agent = find_agent(request.agent_name)
 
         if request.session_id and request.session and request.session_id != request.session.id:
@@ -204,41 +245,23 @@ def create_app(
             create_resource_url=create_resource_url,
         ).execute(request.input, wait=ready)
 
-        match request.mode:
-            case RunMode.STREAM:
-                return StreamingResponse(
-                    stream_sse(run_data, run_store, 0, ready=ready),
-                    headers=headers,
-                    media_type="text/event-stream",
-                )
-            case RunMode.SYNC:
-                await wait_util_stop(run_data, run_store, ready=ready)
-                return JSONResponse(
-                    headers=headers,
-                    content=jsonable_encoder(run_data.run),
-                )
-            case RunMode.ASYNC:
-                ready.set()
-                return JSONResponse(
-                    status_code=status.HTTP_202_ACCEPTED,
-                    headers=headers,
-                    content=jsonable_encoder(run_data.run),
-                )
-            case _:
-                raise NotImplementedError()
-
-    @app.get("/runs/{run_id}")
-    async def read_run(run_id: RunId) -> RunReadResponse:
+        respond = mode_responses.get(request.mode)
+        if not respond:
+            raise NotImplementedError()
+        return await respond(run_data, idx=0, headers=headers, ready=ready)
+
+    @app.get("/runs/{run_id}", response_model=RunReadResponse)
+    async def read_run(run_id: RunId) -> Response:
         bundle = await find_run_data(run_id)
-        return bundle.run
+        return run_response(bundle.run)
 
     @app.get("/runs/{run_id}/events")
     async def list_run_events(run_id: RunId) -> RunEventsListResponse:
         bundle = await find_run_data(run_id)
         return RunEventsListResponse(events=bundle.events)
 
-    @app.post("/runs/{run_id}")
-    async def resume_run(run_id: RunId, request: RunResumeRequest) -> RunResumeResponse:
+    @app.post("/runs/{run_id}", response_model=RunResumeResponse)
+    async def resume_run(run_id: RunId, request: RunResumeRequest) -> Response:
         run_data = await find_run_data(run_id)
 
         if run_data.run.await_request is None:
@@ -254,25 +277,13 @@ def create_app(
         await run_store.set(run_data.key, run_data)
         await run_resume_store.set(run_data.key, request.await_resume)
 
-        match request.mode:
-            case RunMode.STREAM:
-                return StreamingResponse(
-                    stream_sse(run_data, run_store, len(run_data.events)),
-                    media_type="text/event-stream",
-                )
-            case RunMode.SYNC:
-                run_data = await wait_util_stop(run_data, run_store)
-                return run_data.run
-            case RunMode.ASYNC:
-                return JSONResponse(
-                    status_code=status.HTTP_202_ACCEPTED,
-                    content=jsonable_encoder(run_data.run),
-                )
-            case _:
-                raise NotImplementedError()
-
-    @app.post("/runs/{run_id}/cancel")
-    async def cancel_run(run_id: RunId) -> RunCancelResponse:
+        respond = mode_responses.get(request.mode)
+        if not respond:
+            raise NotImplementedError()
+        return await respond(run_data, idx=len(run_data.events), headers=None, ready=None)
+
+    @app.post("/runs/{run_id}/cancel", response_model=RunCancelResponse)
+    async def cancel_run(run_id: RunId) -> Response:
         run_data = await find_run_data(run_id)
         if run_data.run.status.is_terminal:
             raise HTTPException(
@@ -281,7 +292,7 @@ def create_app(
             )
         await run_cancel_store.set(run_data.key, CancelData())
         run_data.run.status = RunStatus.CANCELLING
-        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=jsonable_encoder(run_data.run))
+        return run_response(run_data.run, status_code=status.HTTP_202_ACCEPTED)
 
     @app.get("/sessions/{session_id}")
     async def read_session(session_id: SessionId) -> SessionReadResponse:
@@ -101,9 +101,13 @@ class Executor:
 
         self.logger = logging.LoggerAdapter(logger, {"run_id": str(run_data.run.run_id)})
 
+        self._resume_watch: AsyncGenerator[AwaitResume | None] | None = None
+
     def execute(self, input: list[Message], *, wait: asyncio.Event) -> None:
         self.task = asyncio.create_task(self._execute(input=input, executor=self.executor, wait=wait))
         self.watcher = asyncio.create_task(self._watch_for_cancellation())
+        # Store watches never end on their own, stop watching once the run is over
+        self.task.add_done_callback(lambda _: self.watcher.cancel())
 
     async def _push(self) -> None:
         await self.run_store.set(self.run_data.run.run_id, self.run_data)
@@ -114,7 +118,10 @@ class Executor:
         await self._push()
 
     async def _await(self) -> AwaitResume:
-        async for resume in self.resume_store.watch(self.run_data.key):
+        # Keep a single watch for all awaits of the run instead of subscribing on every resume
+        if self._resume_watch is None:
+            self._resume_watch = self.resume_store.watch(self.run_data.key)
+        async for resume in self._resume_watch:
             if resume is not None:
                 await self.resume_store.set(self.run_data.key, None)
                 return resume
@@ -239,6 +246,9 @@ class Executor:
                 run_data.run.finished_at = datetime.now(timezone.utc)
                 await self._emit(RunFailedEvent(run=run_data.run))
                 self.logger.exception("Run failed")
+            finally:
+                if self._resume_watch is not None:
+                    await self._resume_watch.aclose()
 
     async def _execute_agent(
         self,
@@ -22,6 +22,18 @@ from acp_sdk.server.utils import async_request_with_retry
 from acp_sdk.shared.resources import ResourceLoader, ResourceStore
 
 
+def loop_factory(loop: uvicorn.config.LoopSetupType) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    if loop in ("auto", "uvloop"):
+        try:
+            import uvloop
+        except ImportError:
+            if loop == "uvloop":
+                raise
+        else:
+            return uvloop.new_event_loop
+    return None
+
+
 class Server:
     def __init__(self) -> None:
         self.agents: list[AgentManifest] = []
@@ -131,8 +143,8 @@ class Server:
 
         if configure_logger:
             configure_logger_func()
-        if configure_telemetry:
-            configure_telemetry_func(app)
+        if configure_telemetry and not configure_telemetry_func(app):
+            logger.debug("Telemetry is disabled by OTEL_SDK_DISABLED, the app is not instrumented.")
 
         config = uvicorn.Config(
             app,
@@ -248,63 +260,65 @@ class Server:
         factory: bool = False,
         h11_max_incomplete_event_size: int | None = None,
     ) -> None:
-        asyncio.run(
-            self.serve(
-                configure_logger=configure_logger,
-                configure_telemetry=configure_telemetry,
-                self_registration=self_registration,
-                store=store,
-                resource_store=resource_store,
-                resource_loader=resource_loader,
-                host=host,
-                port=port,
-                uds=uds,
-                fd=fd,
-                loop=loop,
-                http=http,
-                ws=ws,
-                ws_max_size=ws_max_size,
-                ws_max_queue=ws_max_queue,
-                ws_ping_interval=ws_ping_interval,
-                ws_ping_timeout=ws_ping_timeout,
-                ws_per_message_deflate=ws_per_message_deflate,
-                lifespan=lifespan,
-                env_file=env_file,
-                log_config=log_config,
-                log_level=log_level,
-                access_log=access_log,
-                use_colors=use_colors,
-                interface=interface,
-                reload=reload,
-                reload_dirs=reload_dirs,
-                reload_delay=reload_delay,
-                reload_includes=reload_includes,
-                reload_excludes=reload_excludes,
-                workers=workers,
-                proxy_headers=proxy_headers,
-                server_header=server_header,
-                date_header=date_header,
-                forwarded_allow_ips=forwarded_allow_ips,
-                root_path=root_path,
-                limit_concurrency=limit_concurrency,
-                limit_max_requests=limit_max_requests,
-                backlog=backlog,
-                timeout_keep_alive=timeout_keep_alive,
-                timeout_notify=timeout_notify,
-                timeout_graceful_shutdown=timeout_graceful_shutdown,
-                callback_notify=callback_notify,
-                ssl_keyfile=ssl_keyfile,
-                ssl_certfile=ssl_certfile,
-                ssl_keyfile_password=ssl_keyfile_password,
-                ssl_version=ssl_version,
-                ssl_cert_reqs=ssl_cert_reqs,
-                ssl_ca_certs=ssl_ca_certs,
-                ssl_ciphers=ssl_ciphers,
-                headers=headers,
-                factory=factory,
-                h11_max_incomplete_event_size=h11_max_incomplete_event_size,
+        # serve runs on the caller's loop, so pick the loop uvicorn would (uvloop when available) here
+        with asyncio.Runner(loop_factory=loop_factory(loop)) as runner:
+            runner.run(
+                self.serve(
+                    configure_logger=configure_logger,
+                    configure_telemetry=configure_telemetry,
+                    self_registration=self_registration,
+                    store=store,
+                    resource_store=resource_store,
+                    resource_loader=resource_loader,
+                    host=host,
+                    port=port,
+                    uds=uds,
+                    fd=fd,
+                    loop=loop,
+                    http=http,
+                    ws=ws,
+                    ws_max_size=ws_max_size,
+                    ws_max_queue=ws_max_queue,
+                    ws_ping_interval=ws_ping_interval,
+                    ws_ping_timeout=ws_ping_timeout,
+                    ws_per_message_deflate=ws_per_message_deflate,
+                    lifespan=lifespan,
+                    env_file=env_file,
+                    log_config=log_config,
+                    log_level=log_level,
+                    access_log=access_log,
+                    use_colors=use_colors,
+                    interface=interface,
+                    reload=reload,
+                    reload_dirs=reload_dirs,
+                    reload_delay=reload_delay,
+                    reload_includes=reload_includes,
+                    reload_excludes=reload_excludes,
+                    workers=workers,
+                    proxy_headers=proxy_headers,
+                    server_header=server_header,
+                    date_header=date_header,
+                    forwarded_allow_ips=forwarded_allow_ips,
+                    root_path=root_path,
+                    limit_concurrency=limit_concurrency,
+                    limit_max_requests=limit_max_requests,
+                    backlog=backlog,
+                    timeout_keep_alive=timeout_keep_alive,
+                    timeout_notify=timeout_notify,
+                    timeout_graceful_shutdown=timeout_graceful_shutdown,
+                    callback_notify=callback_notify,
+                    ssl_keyfile=ssl_keyfile,
+                    ssl_certfile=ssl_certfile,
+                    ssl_keyfile_password=ssl_keyfile_password,
+                    ssl_version=ssl_version,
+                    ssl_cert_reqs=ssl_cert_reqs,
+                    ssl_ca_certs=ssl_ca_certs,
+                    ssl_ciphers=ssl_ciphers,
+                    headers=headers,
+                    factory=factory,
+                    h11_max_incomplete_event_size=h11_max_incomplete_event_size,
+                )
             )
-        )
 
     async def _serve(self, self_registration: bool = True) -> None:
         registration_task = asyncio.create_task(self._register_agent()) if self_registration else None
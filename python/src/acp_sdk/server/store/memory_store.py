@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator
 from datetime import datetime
 from typing import Generic
 
@@ -13,7 +13,9 @@ class MemoryStore(Store[T], Generic[T]):
     def __init__(self, *, limit: int, ttl: int | None = None) -> None:
         super().__init__()
         self._cache: TTLCache[str, str] = TTLCache(maxsize=limit, ttl=ttl, timer=datetime.now)
-        self._event = asyncio.Event()
+        # Watchers compare versions instead of clearing a shared event, so none of them misses an update
+        self._version = 0
+        self._changed = asyncio.Condition()
 
     async def get(self, key: Stringable) -> T | None:
         value = self._cache.get(str(key))
@@ -24,12 +26,17 @@ class MemoryStore(Store[T], Generic[T]):
             del self._cache[str(key)]
         else:
             self._cache[str(key)] = value.model_dump_json()
-        self._event.set()
+        self._version += 1
+        async with self._changed:
+            self._changed.notify_all()
 
-    async def watch(self, key: Stringable, *, ready: asyncio.Event | None = None) -> AsyncIterator[T | None]:
+    async def watch(self, key: Stringable, *, ready: asyncio.Event | None = None) -> AsyncGenerator[T | None]:
+        version = self._version
         if ready:
             ready.set()
         while True:
-            await self._event.wait()
-            self._event.clear()
+            async with self._changed:
+                while self._version == version:
+                    await self._changed.wait()
+            version = self._version
             yield await self.get(key)
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator
 from typing import Generic
 
 from psycopg import AsyncConnection
@@ -46,7 +46,7 @@ class PostgreSQLStore(Store[T], Generic[T]):
             await cur.execute(f"NOTIFY {self._channel}, '{key!s}'")  # NOTIFY appears not to accept params
             await self._aconn.commit()
 
-    async def watch(self, key: Stringable, *, ready: asyncio.Event | None = None) -> AsyncIterator[T | None]:
+    async def watch(self, key: Stringable, *, ready: asyncio.Event | None = None) -> AsyncGenerator[T | None]:
         notify_conn = await AsyncConnection.connect(
             conninfo=f"{self._aconn.info.dsn} password={self._aconn.info.password}", autocommit=True
         )
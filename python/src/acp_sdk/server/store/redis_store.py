@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator
 from typing import Generic
 
 from redis.asyncio import Redis
@@ -23,7 +23,7 @@ class RedisStore(Store[T], Generic[T]):
         else:
             await self._redis.set(name=str(key), value=value.model_dump_json())
 
-    async def watch(self, key: Stringable, *, ready: asyncio.Event | None = None) -> AsyncIterator[T]:
+    async def watch(self, key: Stringable, *, ready: asyncio.Event | None = None) -> AsyncGenerator[T]:
         await self._redis.config_set("notify-keyspace-events", "KEA")
 
         pubsub = self._redis.pubsub()
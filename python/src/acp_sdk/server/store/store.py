@@ -1,6 +1,6 @@
 import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator
 from typing import Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict
@@ -26,7 +26,7 @@ class Store(Generic[T], ABC):
         pass
 
     @abstractmethod
-    def watch(self, key: Stringable, *, ready: asyncio.Event | None = None) -> AsyncIterator[T | None]:
+    def watch(self, key: Stringable, *, ready: asyncio.Event | None = None) -> AsyncGenerator[T | None]:
         pass
 
     def as_store(self, model: type[U], prefix: Stringable = "") -> "Store[U]":
@@ -47,7 +47,7 @@ class StoreView(Store[U], Generic[U]):
     async def set(self, key: Stringable, value: U | None) -> None:
         await self._store.set(self._get_key(key), value)
 
-    async def watch(self, key: Stringable, *, ready: asyncio.Event | None = None) -> AsyncIterator[U | None]:
+    async def watch(self, key: Stringable, *, ready: asyncio.Event | None = None) -> AsyncGenerator[U | None]:
         async for value in self._store.watch(self._get_key(key), ready=ready):
             yield self._model.model_validate(value.model_dump()) if value else value
 
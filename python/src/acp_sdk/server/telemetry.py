@@ -1,4 +1,5 @@
 import logging
+import os
 
 from fastapi import FastAPI
 from opentelemetry import metrics, trace
@@ -24,8 +25,14 @@ from acp_sdk.version import __version__
 root_logger = logging.getLogger()
 
 
-def configure_telemetry(app: FastAPI) -> None:
-    """Utility that configures opentelemetry with OTLP exporter and FastAPI instrumentation"""
+def configure_telemetry(app: FastAPI) -> bool:
+    """Utility that configures opentelemetry with OTLP exporter and FastAPI instrumentation
+
+    Returns False without instrumenting the app when OTEL_SDK_DISABLED is set to true.
+    """
+
+    if os.getenv("OTEL_SDK_DISABLED", "false").strip().lower() == "true":
+        return False
 
     FastAPIInstrumentor.instrument_app(app)
 
@@ -55,3 +62,5 @@ def configure_telemetry(app: FastAPI) -> None:
     processor = BatchLogRecordProcessor(OTLPLogExporter())
     logger_provider.add_log_record_processor(processor)
     root_logger.addHandler(LoggingHandler(logger_provider=logger_provider))
+
+    return True
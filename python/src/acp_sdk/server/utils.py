@@ -1,19 +1,25 @@
 import asyncio
-from collections.abc import AsyncGenerator, Coroutine
+import os
+from collections.abc import AsyncGenerator, AsyncIterator, Coroutine
+from datetime import timedelta
 from typing import Any, Callable
 
 import httpx
 import requests
 from pydantic import BaseModel
+from sse_starlette.event import ServerSentEvent
 
 from acp_sdk.models import RunStatus
 from acp_sdk.server.executor import RunData
 from acp_sdk.server.logging import logger
 from acp_sdk.server.store import Store
 
+STREAM_BATCH_WINDOW = timedelta(milliseconds=int(os.getenv("ACP_STREAM_BATCH_MS", "30")))
+STREAM_BATCH_SIZE = int(os.getenv("ACP_STREAM_BATCH_N", "16"))
 
-def encode_sse(model: BaseModel) -> str:
-    return f"data: {model.model_dump_json()}\n\n"
+
+def encode_sse(model: BaseModel) -> ServerSentEvent:
+    return ServerSentEvent(data=model.model_dump_json())
 
 
 async def watch_util_stop(
@@ -32,15 +38,68 @@ async def wait_util_stop(run_data: RunData, store: Store[RunData], *, ready: asy
     return data
 
 
+async def batch_sse(
+    events: AsyncIterator[ServerSentEvent], *, window: timedelta, size: int
+) -> AsyncGenerator[ServerSentEvent | bytes]:
+    """Coalesce events arriving within the window into a single write, the first event is never delayed"""
+    if window <= timedelta() or size <= 1:
+        async for event in events:
+            yield event
+        return
+
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Future[ServerSentEvent] | None = None
+    first = True
+    try:
+        while True:
+            pending = pending or asyncio.ensure_future(events.__anext__())
+            try:
+                batch = [await pending]
+            except StopAsyncIteration:
+                return
+            finally:
+                pending = None
+
+            if first:
+                first = False
+                yield batch[0]
+                continue
+
+            exhausted = False
+            deadline = loop.time() + window.total_seconds()
+            while len(batch) < size:
+                pending = asyncio.ensure_future(events.__anext__())
+                done, _ = await asyncio.wait([pending], timeout=max(deadline - loop.time(), 0))
+                if not done:
+                    break
+                pending = None
+                try:
+                    batch.append(done.pop().result())
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+
+            yield batch[0] if len(batch) == 1 else b"".join(event.encode() for event in batch)
+            if exhausted:
+                return
+    finally:
+        if pending:
+            pending.cancel()
+
+
 async def stream_sse(
     run_data: RunData, store: Store[RunData], idx: int, *, ready: asyncio.Event | None = None
-) -> AsyncGenerator[str]:
-    next_event_idx = idx
-    async for data in watch_util_stop(run_data, store, ready=ready):
-        new_events = data.events[next_event_idx:]
-        next_event_idx = len(data.events)
-        for event in new_events:
-            yield encode_sse(event)
+) -> AsyncGenerator[ServerSentEvent | bytes]:
+    async def stream_events() -> AsyncGenerator[ServerSentEvent]:
+        next_event_idx = idx
+        async for data in watch_util_stop(run_data, store, ready=ready):
+            new_events = data.events[next_event_idx:]
+            next_event_idx = len(data.events)
+            for event in new_events:
+                yield encode_sse(event)
+
+    async for chunk in batch_sse(stream_events(), window=STREAM_BATCH_WINDOW, size=STREAM_BATCH_SIZE):
+        yield chunk
 
 
 async def async_request_with_retry(
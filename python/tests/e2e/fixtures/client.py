@@ -1,12 +1,28 @@
 from collections.abc import AsyncIterator
 
+import httpx
+import pytest
 import pytest_asyncio
 from acp_sdk.client import Client
+from acp_sdk.server.store import Store
 
 from e2e.config import Config
 
 
-@pytest_asyncio.fixture
-async def client() -> AsyncIterator[Client]:
-    async with Client(base_url=f"http://localhost:{Config.PORT}") as client:
-        yield client
+@pytest.fixture
+def transport(request: pytest.FixtureRequest, store: Store) -> httpx.AsyncBaseTransport | None:
+    """ASGI transport to the in-process app, or None for tests marked with `uvicorn`"""
+    # The store is requested directly so the tests stay parametrized over it, the app is only built when used
+    if request.node.get_closest_marker("uvicorn"):
+        return None
+    return httpx.ASGITransport(app=request.getfixturevalue("app"))
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def client(transport: httpx.AsyncBaseTransport | None) -> AsyncIterator[Client]:
+    if transport is None:
+        async with Client(base_url=f"http://localhost:{Config.PORT}") as client:
+            yield client
+    else:
+        async with Client(base_url="http://test", transport=transport) as client:
+            yield client
@@ -1,8 +1,7 @@
 import asyncio
 import base64
 import os
-import time
-from collections.abc import AsyncGenerator, AsyncIterator, Generator
+from collections.abc import AsyncGenerator, AsyncIterator
 from datetime import timedelta
 from threading import Thread
 
@@ -12,8 +11,9 @@ import pytest_postgresql.factories
 import pytest_redis.factories
 from acp_sdk.models import Artifact, AwaitResume, Error, ErrorCode, Message, MessageAwaitRequest, MessagePart
 from acp_sdk.models.errors import ACPError
-from acp_sdk.server import Context, Server
+from acp_sdk.server import Context, Server, create_app
 from acp_sdk.server.store import MemoryStore, PostgreSQLStore, RedisStore, Store
+from fastapi import FastAPI
 from psycopg import AsyncConnection
 from pytest_postgresql.executor import PostgreSQLExecutor
 from pytest_postgresql.executor_noop import NoopExecutor
@@ -43,6 +43,10 @@ postgres_db_proc = (
     else pytest_postgresql.factories.postgresql_proc()
 )
 
+PNG_BASE64 = base64.b64encode(
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
+).decode("ascii")
+
 
 @pytest_asyncio.fixture(scope="module", params=["memory", "redis", "postgres"])
 async def store(
@@ -68,8 +72,15 @@ async def store(
             raise AssertionError()
 
 
-@pytest.fixture(scope="module")
-def server(request: pytest.FixtureRequest, store: Store) -> Generator[None]:
+async def wait_for_startup(*servers: Server, timeout: float = 5, interval: float = 0.01) -> None:
+    for _ in range(int(timeout / interval)):
+        if all(server.server and server.server.started for server in servers):
+            return
+        await asyncio.sleep(interval)
+    raise TimeoutError("Server did not start in time")
+
+
+def create_server() -> Server:
     server = Server()
 
     @server.agent()
@@ -124,9 +135,7 @@ def server(request: pytest.FixtureRequest, store: Store) -> Generator[None]:
         yield Message(
             parts=[
                 MessagePart(
-                    content=base64.b64encode(
-                        b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
-                    ).decode("ascii"),
+                    content=PNG_BASE64,
                     content_type="image/png",
                     content_encoding="base64",
                 ),
@@ -144,27 +153,37 @@ def server(request: pytest.FixtureRequest, store: Store) -> Generator[None]:
         yield Artifact(
             name="image.png",
             content_type="image/png",
-            content=base64.b64encode(
-                b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
-            ).decode("ascii"),
+            content=PNG_BASE64,
             content_encoding="base64",
         )
 
-    thread = Thread(
-        target=server.run, kwargs={"self_registration": False, "store": store, "port": Config.PORT}, daemon=True
-    )
-    thread.start()
+    return server
+
+
+@pytest_asyncio.fixture(scope="module")
+async def app(store: Store) -> AsyncGenerator[FastAPI]:
+    """In-process app, served to the client through ASGI transport"""
+    app = create_app(*create_server().agents, store=store)
+    async with app.router.lifespan_context(app):
+        yield app
+
+
+@pytest_asyncio.fixture(scope="module")
+async def server(store: Store) -> AsyncGenerator[Server]:
+    """Uvicorn server on a real port, for tests marked with `uvicorn`"""
+    server = create_server()
 
-    time.sleep(1)
+    task = asyncio.create_task(server.serve(self_registration=False, store=store, port=Config.PORT))
+    await wait_for_startup(server)
 
     yield server
 
     server.should_exit = True
-    thread.join(timeout=2)
+    await task
 
 
-@pytest.fixture(scope="module")
-def multi_server(request: pytest.FixtureRequest) -> Generator[None]:
+@pytest_asyncio.fixture(scope="module")
+async def multi_server(request: pytest.FixtureRequest) -> AsyncGenerator[tuple[Server, Server]]:
     server_one = Server()
     server_two = Server()
 
@@ -185,7 +204,7 @@ def multi_server(request: pytest.FixtureRequest) -> Generator[None]:
     thread_one.start()
     thread_two.start()
 
-    time.sleep(1)
+    await wait_for_startup(server_one, server_two)
 
     yield (server_one, server_two)
 
@@ -1,24 +1,31 @@
 import pytest
 from acp_sdk.client import Client
-from acp_sdk.models import AgentManifest
-from acp_sdk.server import Server
+from acp_sdk.models import AgentManifest, ErrorCode
+from acp_sdk.models.errors import ACPError
 
 
-@pytest.mark.asyncio
-async def test_ping(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_ping(client: Client) -> None:
     await client.ping()
     assert True
 
 
-@pytest.mark.asyncio
-async def test_agents_list(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_agents_list(client: Client) -> None:
     async for agent in client.agents():
         assert isinstance(agent, AgentManifest)
 
 
-@pytest.mark.asyncio
-async def test_agents_manifest(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_agents_manifest(client: Client) -> None:
     agent_name = "echo"
     agent = await client.agent(name=agent_name)
     assert isinstance(agent, AgentManifest)
     assert agent.name == agent_name
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_agents_manifest_not_found(client: Client) -> None:
+    with pytest.raises(ACPError) as e:
+        await client.agent(name="unknown")
+    assert e.value.error.code == ErrorCode.NOT_FOUND
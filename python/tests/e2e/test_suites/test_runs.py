@@ -24,45 +24,46 @@ output = [message.model_copy(update={"role": "agent/echo"}) for message in input
 await_resume = MessageAwaitResume(message=Message(parts=[]))
 
 
-@pytest.mark.asyncio
-async def test_run_sync(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_run_sync(client: Client) -> None:
     run = await client.run_sync(agent="echo", input=input)
     assert run.status == RunStatus.COMPLETED
     assert run.output == output
 
 
-@pytest.mark.asyncio
-async def test_run_async(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_run_async(client: Client) -> None:
     run = await client.run_async(agent="echo", input=input)
     assert run.status == RunStatus.CREATED
 
 
-@pytest.mark.asyncio
-async def test_run_stream(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_run_stream(client: Client) -> None:
     event_stream = [event async for event in client.run_stream(agent="echo", input=input)]
     assert isinstance(event_stream[0], RunCreatedEvent)
     assert isinstance(event_stream[-1], RunCompletedEvent)
     assert event_stream[-1].run.output == output
 
 
-@pytest.mark.asyncio
-async def test_run_status(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_run_status(client: Client) -> None:
     run = await client.run_async(agent="echo", input=input)
     while run.status in (RunStatus.CREATED, RunStatus.IN_PROGRESS):
+        await asyncio.sleep(0.1)
         run = await client.run_status(run_id=run.run_id)
     assert run.status == RunStatus.COMPLETED
 
 
-@pytest.mark.asyncio
-async def test_run_events(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_run_events(client: Client) -> None:
     run = await client.run_sync(agent="echo", input=input)
     events = [event async for event in client.run_events(run_id=run.run_id)]
     assert isinstance(events[0], RunCreatedEvent)
     assert isinstance(events[-1], RunCompletedEvent)
 
 
-@pytest.mark.asyncio
-async def test_run_events_are_stream(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_run_events_are_stream(client: Client) -> None:
     stream = [event async for event in client.run_stream(agent="echo", input=input)]
     print(stream)
     assert isinstance(stream[0], RunCreatedEvent)
@@ -71,18 +72,18 @@ async def test_run_events_are_stream(server: Server, client: Client) -> None:
     assert stream == events
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.parametrize("agent", ["failer", "raiser"])
-async def test_failure(server: Server, client: Client, agent: AgentName) -> None:
+async def test_failure(client: Client, agent: AgentName) -> None:
     run = await client.run_sync(agent=agent, input=input)
     assert run.status == RunStatus.FAILED
     assert run.error is not None
     assert run.error.code == ErrorCode.INVALID_INPUT
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.parametrize("agent", ["awaiter", "slow_echo"])
-async def test_run_cancel(server: Server, client: Client, agent: AgentName) -> None:
+async def test_run_cancel(client: Client, agent: AgentName) -> None:
     run = await client.run_async(agent=agent, input=input)
     run = await client.run_cancel(run_id=run.run_id)
     assert run.status == RunStatus.CANCELLING
@@ -91,7 +92,8 @@ async def test_run_cancel(server: Server, client: Client, agent: AgentName) -> N
     assert run.status == RunStatus.CANCELLED
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.uvicorn
 @pytest.mark.parametrize("agent", ["slow_echo"])
 async def test_run_cancel_stream(server: Server, client: Client, agent: AgentName) -> None:
     last_event = None
@@ -103,8 +105,8 @@ async def test_run_cancel_stream(server: Server, client: Client, agent: AgentNam
     assert isinstance(last_event, RunCancelledEvent)
 
 
-@pytest.mark.asyncio
-async def test_run_resume_sync(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_run_resume_sync(client: Client) -> None:
     run = await client.run_sync(agent="awaiter", input=input)
     assert run.status == RunStatus.AWAITING
     assert run.await_request is not None
@@ -113,8 +115,8 @@ async def test_run_resume_sync(server: Server, client: Client) -> None:
     assert run.status == RunStatus.COMPLETED
 
 
-@pytest.mark.asyncio
-async def test_run_resume_async(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_run_resume_async(client: Client) -> None:
     run = await client.run_sync(agent="awaiter", input=input)
     assert run.status == RunStatus.AWAITING
     assert run.await_request is not None
@@ -123,8 +125,8 @@ async def test_run_resume_async(server: Server, client: Client) -> None:
     assert run.status == RunStatus.IN_PROGRESS
 
 
-@pytest.mark.asyncio
-async def test_run_resume_stream(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_run_resume_stream(client: Client) -> None:
     run = await client.run_sync(agent="awaiter", input=input)
     assert run.status == RunStatus.AWAITING
     assert run.await_request is not None
@@ -134,8 +136,8 @@ async def test_run_resume_stream(server: Server, client: Client) -> None:
     assert isinstance(event_stream[-1], RunCompletedEvent)
 
 
-@pytest.mark.asyncio
-async def test_mime_types(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_mime_types(client: Client) -> None:
     run = await client.run_sync(agent="mime_types", input=input)
     assert run.status == RunStatus.COMPLETED
     assert len(run.output) == 1
@@ -155,8 +157,8 @@ async def test_mime_types(server: Server, client: Client) -> None:
             assert part.content == '{"key": "value"}'
 
 
-@pytest.mark.asyncio
-async def test_base64_encoding(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_base64_encoding(client: Client) -> None:
     run = await client.run_sync(agent="base64_encoding", input=input)
     assert run.status == RunStatus.COMPLETED
     assert len(run.output) == 1
@@ -175,8 +177,8 @@ async def test_base64_encoding(server: Server, client: Client) -> None:
     assert text_part.content_encoding == "plain"
 
 
-@pytest.mark.asyncio
-async def test_artifacts(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_artifacts(client: Client) -> None:
     run = await client.run_sync(agent="artifact_producer", input=input)
     assert run.status == RunStatus.COMPLETED
 
@@ -204,8 +206,8 @@ async def test_artifacts(server: Server, client: Client) -> None:
     base64.b64decode(image_artifact.content)
 
 
-@pytest.mark.asyncio
-async def test_artifact_streaming(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_artifact_streaming(client: Client) -> None:
     events = [event async for event in client.run_stream(agent="artifact_producer", input=input)]
 
     assert isinstance(events[0], RunCreatedEvent)
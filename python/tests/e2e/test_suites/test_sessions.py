@@ -13,7 +13,8 @@ input = [Message(parts=[MessagePart(content="Hello!")])]
 output = [message.model_copy(update={"role": f"agent/{agent}"}) for message in input]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.uvicorn
 async def test_session(server: Server, client: Client) -> None:
     async with client.session() as session:
         run = await session.run_sync(agent=agent, input=input)
@@ -22,8 +23,8 @@ async def test_session(server: Server, client: Client) -> None:
         assert run.output == output * 3
 
 
-@pytest.mark.asyncio
-async def test_session_refresh(server: Server, client: Client) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_session_refresh(client: Client) -> None:
     async with client.session() as session:
         await session.run_async(agent=agent, input=input)
         await asyncio.sleep(2)
@@ -31,7 +32,7 @@ async def test_session_refresh(server: Server, client: Client) -> None:
         assert len(sess.history) == len(input) * 2
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_distributed_session(multi_server: tuple[Server, Server]) -> None:
     one, two = multi_server
     one_url = f"http://localhost:{one.server.config.port}"
@@ -0,0 +1,54 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+
+import httpx
+import pytest
+from acp_sdk.client import Client
+from acp_sdk.models import Message, MessagePart, RunCompletedEvent
+from acp_sdk.server import MemoryStore, agent, create_app
+
+
+def test_stream_from_separate_loops() -> None:
+    @agent()
+    async def echo(input: list[Message]) -> AsyncGenerator[Message]:
+        for message in input:
+            yield message
+
+    async def stream() -> None:
+        app = create_app(echo)
+        async with (
+            app.router.lifespan_context(app),
+            Client(base_url="http://test", transport=httpx.ASGITransport(app=app)) as client,
+        ):
+            events = [
+                event
+                async for event in client.run_stream(agent="echo", input=[Message(parts=[MessagePart(content="Hi")])])
+            ]
+        assert isinstance(events[-1], RunCompletedEvent)
+
+    # Every run gets a fresh loop, as with servers running in threads
+    asyncio.run(stream())
+    asyncio.run(stream())
+
+
+@pytest.mark.asyncio
+async def test_repeated_runs_on_memory_store() -> None:
+    @agent()
+    async def echo(input: list[Message]) -> AsyncGenerator[Message]:
+        for message in input:
+            yield message
+
+    app = create_app(echo, store=MemoryStore(limit=1000, ttl=timedelta(minutes=1)))
+    input = [Message(parts=[MessagePart(content="Hi")])]
+    async with (
+        app.router.lifespan_context(app),
+        Client(base_url="http://test", transport=httpx.ASGITransport(app=app)) as client,
+    ):
+        # Concurrent watchers of the store must not miss each other's updates
+        for _ in range(20):
+            async with asyncio.timeout(5):
+                await client.run_sync(agent="echo", input=input)
+                await client.run_async(agent="echo", input=input)
+                events = [event async for event in client.run_stream(agent="echo", input=input)]
+            assert isinstance(events[-1], RunCompletedEvent)
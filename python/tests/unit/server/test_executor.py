@@ -0,0 +1,114 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Generator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any
+
+import obstore.store
+import pytest
+from acp_sdk.models import (
+    AwaitResume,
+    Message,
+    MessageAwaitRequest,
+    MessageAwaitResume,
+    MessagePart,
+    ResourceId,
+    ResourceUrl,
+    Run,
+    RunStatus,
+    Session,
+)
+from acp_sdk.server import AgentManifest, MemoryStore, Store, agent
+from acp_sdk.server.executor import CancelData, Executor, RunData
+from acp_sdk.shared import ResourceLoader, ResourceStore
+
+
+@pytest.fixture
+def thread_pool() -> Generator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor() as thread_pool:
+        yield thread_pool
+
+
+def create_store() -> MemoryStore:
+    return MemoryStore(limit=100, ttl=timedelta(minutes=1))
+
+
+def create_executor(
+    agent: AgentManifest, resume_store: Store[AwaitResume], thread_pool: ThreadPoolExecutor
+) -> Executor:
+    async def create_resource_url(id: ResourceId) -> ResourceUrl:
+        return ResourceUrl(url=f"http://test/{id}")
+
+    store = create_store()
+    session = Session()
+    return Executor(
+        agent=agent,
+        run_data=RunData(run=Run(agent_name=agent.name, session_id=session.id)),
+        session=session,
+        executor=thread_pool,
+        request=None,
+        run_store=store.as_store(model=RunData, prefix="run_"),
+        cancel_store=store.as_store(model=CancelData, prefix="run_cancel_"),
+        resume_store=resume_store,
+        session_store=store.as_store(model=Session, prefix="session_"),
+        resource_store=ResourceStore(store=obstore.store.MemoryStore()),
+        resource_loader=ResourceLoader(),
+        create_resource_url=create_resource_url,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cancellation_watcher_stops_with_run(thread_pool: ThreadPoolExecutor) -> None:
+    @agent()
+    async def echo(input: list[Message]) -> AsyncIterator[Message]:
+        for message in input:
+            yield message
+
+    executor = create_executor(echo, create_store().as_store(model=AwaitResume, prefix="run_resume_"), thread_pool)
+    ready = asyncio.Event()
+    ready.set()
+    executor.execute([Message(parts=[MessagePart(content="Howdy!")])], wait=ready)
+    await asyncio.wait_for(executor.task, timeout=5)
+    await asyncio.wait([executor.watcher], timeout=1)
+
+    assert executor.run_data.run.status == RunStatus.COMPLETED
+    assert executor.watcher.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_resume_watch_is_reused(thread_pool: ThreadPoolExecutor) -> None:
+    @agent()
+    async def awaiter(input: list[Message]) -> AsyncGenerator[MessagePart | MessageAwaitRequest, AwaitResume]:
+        for _ in range(2):
+            yield MessageAwaitRequest(message=Message(parts=[]))
+        yield MessagePart(content="done")
+
+    resume_store = create_store().as_store(model=AwaitResume, prefix="run_resume_")
+    watches = 0
+    watch = resume_store.watch
+
+    def counting_watch(*args: Any, **kwargs: Any) -> AsyncGenerator[AwaitResume | None]:
+        nonlocal watches
+        watches += 1
+        return watch(*args, **kwargs)
+
+    resume_store.watch = counting_watch
+
+    executor = create_executor(awaiter, resume_store, thread_pool)
+    run_data = executor.run_data
+    ready = asyncio.Event()
+    ready.set()
+    executor.execute([], wait=ready)
+    for _ in range(2):
+        for _ in range(500):
+            if run_data.run.status == RunStatus.AWAITING:
+                break
+            await asyncio.sleep(0.01)
+        else:
+            raise TimeoutError
+        run_data.run.status = RunStatus.IN_PROGRESS
+        await resume_store.set(run_data.key, MessageAwaitResume(message=Message(parts=[])))
+    await asyncio.wait_for(executor.task, timeout=5)
+
+    assert run_data.run.status == RunStatus.COMPLETED
+    assert watches == 1
@@ -29,3 +29,21 @@ async def test_lifespan() -> None:
 
     assert entry
     assert exit
+
+
+def test_run_uses_uvloop() -> None:
+    uvloop = pytest.importorskip("uvloop")
+    loop_type = None
+
+    class TestServer(Server):
+        @asynccontextmanager
+        async def lifespan(self, app: FastAPI) -> AsyncGenerator[None]:
+            nonlocal loop_type
+            loop_type = type(asyncio.get_running_loop())
+            self.should_exit = True
+            yield
+
+    TestServer().run(configure_logger=False, self_registration=False, port=0)
+
+    assert loop_type is not None
+    assert issubclass(loop_type, uvloop.Loop)
@@ -0,0 +1,41 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+import pytest
+from acp_sdk.server.utils import batch_sse
+from sse_starlette.event import ServerSentEvent
+
+
+async def produce(delays: list[float]) -> AsyncIterator[ServerSentEvent]:
+    for i, delay in enumerate(delays):
+        await asyncio.sleep(delay)
+        yield ServerSentEvent(data=str(i))
+
+
+@pytest.mark.asyncio
+async def test_batch_sse_coalesces_events() -> None:
+    chunks = [
+        chunk async for chunk in batch_sse(produce([0, 0, 0, 0, 0.2, 0]), window=timedelta(milliseconds=50), size=16)
+    ]
+
+    assert isinstance(chunks[0], ServerSentEvent)
+    assert chunks[0].data == "0"
+    assert chunks[1] == b"".join(ServerSentEvent(data=str(i)).encode() for i in range(1, 4))
+    assert chunks[2] == b"".join(ServerSentEvent(data=str(i)).encode() for i in range(4, 6))
+
+
+@pytest.mark.asyncio
+async def test_batch_sse_respects_size() -> None:
+    chunks = [chunk async for chunk in batch_sse(produce([0] * 5), window=timedelta(seconds=1), size=2)]
+
+    assert len(chunks) == 3
+    assert chunks[1] == b"".join(ServerSentEvent(data=str(i)).encode() for i in range(1, 3))
+    assert chunks[2] == b"".join(ServerSentEvent(data=str(i)).encode() for i in range(3, 5))
+
+
+@pytest.mark.asyncio
+async def test_batch_sse_disabled() -> None:
+    chunks = [chunk async for chunk in batch_sse(produce([0] * 3), window=timedelta(), size=16)]
+
+    assert [chunk.data for chunk in chunks] == ["0", "1", "2"]